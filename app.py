@@ -5,26 +5,69 @@ This brings everything together into an interactive web app
 
 import streamlit as st
 import pandas as pd
-from calculator import ArchitectureCalculator
+import numpy as np
+from calculator import ArchitectureCalculator, score_scenarios
 from visualizations import (
-    create_cost_comparison_chart,
-    create_carbon_comparison_chart,
     create_radar_chart,
     create_score_gauge,
+    create_annual_projection_chart,
+    create_bar_chart,
     create_comparison_table,
-    create_annual_projection_chart
+    style_comparison_table
 )
-from data import PRICING, SECURITY_SCORES
+from data import PRICING, AVAILABILITY, SECURITY_BREAKDOWN
 
-# Page configuration
-st.set_page_config(
-    page_title="Green Tech Cloud Architecture Dashboard",
-    page_icon="🌱",
-    layout="wide"
-)
+# Cached computations
+# Streamlit reruns this whole script on every slider change, so the results
+# are cached on the slider values and only recomputed for new inputs
+@st.cache_data(max_entries=128)
+def compute_metrics(storage_gb, requests_millions,
+                    cost_weight, carbon_weight, security_weight):
+    """Get metrics for all architectures for the given inputs"""
+    calculator = ArchitectureCalculator(
+        storage_gb=storage_gb,
+        requests_millions=requests_millions,
+        cost_weight=cost_weight,
+        carbon_weight=carbon_weight,
+        security_weight=security_weight
+    )
+    return calculator.get_all_metrics()
 
-# Custom CSS for better styling
-st.markdown("""
+@st.cache_data(max_entries=128)
+def compute_recommendation(storage_gb, requests_millions,
+                           cost_weight, carbon_weight, security_weight):
+    """Get the recommended architecture for the given inputs"""
+    calculator = ArchitectureCalculator(
+        storage_gb=storage_gb,
+        requests_millions=requests_millions,
+        cost_weight=cost_weight,
+        carbon_weight=carbon_weight,
+        security_weight=security_weight
+    )
+    # Reuse the (cached) metrics rather than scoring everything again
+    metrics = compute_metrics(storage_gb, requests_millions,
+                              cost_weight, carbon_weight, security_weight)
+    return calculator.get_recommendation(metrics)
+
+@st.cache_data(max_entries=128)
+def compute_win_shares(storage_gb, requests_millions):
+    """
+    Share of all priority settings (every 1-10 combination of the three
+    sliders) in which each architecture would be recommended for this workload
+    """
+    weights = np.arange(1, 11)
+    cost_weights, carbon_weights, security_weights = np.meshgrid(
+        weights, weights, weights, indexing='ij'
+    )
+    scores = score_scenarios(storage_gb, requests_millions,
+                             cost_weights, carbon_weights, security_weights)
+    
+    # argmax keeps the first of tied scores, like get_recommendation()
+    winners = scores.argmax(axis=-1).ravel()
+    return np.bincount(winners, minlength=scores.shape[-1]) / winners.size
+
+# Static page chrome (CSS, header, footer)
+CSS_HTML = """
     <style>
     .main-header {
         font-size: 2.5rem;
@@ -52,13 +95,31 @@ st.markdown("""
         text-align: center;
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+HEADER_HTML = '<h1 class="main-header">🌱 Green Tech Cloud Architecture Decision Tool</h1>'
+SUB_HEADER_HTML = '<p class="sub-header">Find the perfect balance between Security, Cost, and Sustainability</p>'
+
+FOOTER_HTML = """
+<div style="text-align: center; color: #888; padding: 2rem;">
+    <p>🌱 Green Tech Cloud Architecture Decision Tool v1.0</p>
+    <p>Built with Streamlit, Python, and ❤️ for sustainable technology</p>
+</div>
+"""
+
+# Page configuration
+st.set_page_config(
+    page_title="Green Tech Cloud Architecture Dashboard",
+    page_icon="🌱",
+    layout="wide"
+)
+
+# Custom CSS for better styling
+st.markdown(CSS_HTML, unsafe_allow_html=True)
 
 # Header
-st.markdown('<h1 class="main-header">🌱 Green Tech Cloud Architecture Decision Tool</h1>', 
-            unsafe_allow_html=True)
-st.markdown('<p class="sub-header">Find the perfect balance between Security, Cost, and Sustainability</p>', 
-            unsafe_allow_html=True)
+st.markdown(HEADER_HTML, unsafe_allow_html=True)
+st.markdown(SUB_HEADER_HTML, unsafe_allow_html=True)
 
 # Sidebar for inputs
 with st.sidebar:
@@ -118,102 +179,76 @@ with st.sidebar:
     col2.metric("Carbon", f"{(carbon_weight/total_weight)*100:.0f}%")
     col3.metric("Security", f"{(security_weight/total_weight)*100:.0f}%")
 
-# Main content area
-# Initialize calculator with user inputs
-calculator = ArchitectureCalculator(
-    storage_gb=storage_gb,
-    requests_millions=requests_millions,
-    cost_weight=cost_weight,
-    carbon_weight=carbon_weight,
-    security_weight=security_weight
-)
-
-# Get metrics and recommendation
-metrics = calculator.get_all_metrics()
-recommendation = calculator.get_recommendation()
-
-# Display recommendation
-st.header(" Recommendation")
-col1, col2 = st.columns([2, 1])
-
-with col1:
-    st.markdown(f"""
-<div class="recommendation-box">
-<h2 style="color: #2E7D32;">Recommended: {recommendation['recommended']}</h2>
-<p style="font-size: 1.1rem; color: #2E7D32;">
-{recommendation['reason']}
-</p>
-<p style="margin-top: 1rem; color: #2E7D32;">
-<strong>Overall Score: {recommendation['score']}/100</strong>
-</p>
-</div>
-""", unsafe_allow_html=True)
-
-with col2:
-    fig_gauge = create_score_gauge(recommendation['score'], "Winner Score")
-    st.plotly_chart(fig_gauge, use_container_width=True)
-
-# Key Metrics Overview
-st.header(" Key Metrics Comparison")
-
-# Display comparison table
-st.subheader("Detailed Comparison Table")
-comparison_df = create_comparison_table(metrics)
-st.dataframe(
-    comparison_df,
-    use_container_width=True,
-    hide_index=True
-)
-
-# Visualizations in tabs
-tab1, tab2, tab3, tab4 = st.tabs([" Cost Analysis", " Environmental Impact", 
-                                   " Multi-Factor Analysis", " Projections"])
-
-with tab1:
+# Analysis tabs
+def render_cost_tab(metrics):
+    """Draw the cost analysis tab"""
     col1, col2 = st.columns(2)
     with col1:
-        fig_cost = create_cost_comparison_chart(metrics)
-        st.plotly_chart(fig_cost, use_container_width=True)
+        chart_cost = create_bar_chart(metrics, 'monthly_cost', 'Monthly Cost Comparison',
+                                      'Cost (USD)', '${:,.0f}')
+        st.altair_chart(chart_cost, width="stretch")
     with col2:
         fig_projection = create_annual_projection_chart(metrics)
         st.plotly_chart(fig_projection, use_container_width=True)
     
-    # Cost insights
+    # Cost insights (find the extremes once and reuse them below)
+    cheapest = min(metrics.values(), key=lambda v: v['monthly_cost'])
+    priciest = max(metrics.values(), key=lambda v: v['monthly_cost'])
+    cheapest_annual = min(metrics.values(), key=lambda v: v['annual_cost'])['annual_cost']
+    priciest_annual = max(metrics.values(), key=lambda v: v['annual_cost'])['annual_cost']
     st.info(f"""
     💡 **Cost Insights:**
-    - Lowest monthly cost: {min(metrics.items(), key=lambda x: x[1]['monthly_cost'])[1]['name']} 
-      (${min(metrics.items(), key=lambda x: x[1]['monthly_cost'])[1]['monthly_cost']:,.2f})
-    - Highest monthly cost: {max(metrics.items(), key=lambda x: x[1]['monthly_cost'])[1]['name']} 
-      (${max(metrics.items(), key=lambda x: x[1]['monthly_cost'])[1]['monthly_cost']:,.2f})
+    - Lowest monthly cost: {cheapest['name']} 
+      (${cheapest['monthly_cost']:,.2f})
+    - Highest monthly cost: {priciest['name']} 
+      (${priciest['monthly_cost']:,.2f})
     - Potential annual savings by choosing the cheapest option: 
-      ${(max(metrics.items(), key=lambda x: x[1]['annual_cost'])[1]['annual_cost'] - min(metrics.items(), key=lambda x: x[1]['annual_cost'])[1]['annual_cost']):,.2f}
+      ${(priciest_annual - cheapest_annual):,.2f}
     """)
 
-with tab2:
+def render_carbon_tab(metrics):
+    """Draw the environmental impact tab"""
     col1, col2 = st.columns(2)
     with col1:
-        fig_carbon = create_carbon_comparison_chart(metrics)
-        st.plotly_chart(fig_carbon, use_container_width=True)
+        chart_carbon = create_bar_chart(metrics, 'monthly_carbon', 'Monthly Carbon Footprint',
+                                        'CO₂ Emissions (kg)', '{:.1f} kg')
+        st.altair_chart(chart_carbon, width="stretch")
     with col2:
         # Carbon equivalents
         st.subheader("🌳 Environmental Equivalents")
-        for arch, data in metrics.items():
-            annual_carbon = data['annual_carbon']
-            trees_needed = annual_carbon / 21  # One tree absorbs ~21kg CO2/year
-            st.metric(
-                data['name'],
-                f"{annual_carbon:.0f} kg CO₂/year",
-                f"≈ {trees_needed:.0f} trees needed to offset"
-            )
+        # One table for all architectures instead of a metric card each
+        equivalents_df = pd.DataFrame({
+            'Architecture': [data['name'] for data in metrics.values()],
+            'Annual CO₂': [data['annual_carbon'] for data in metrics.values()]
+        })
+        # One tree absorbs ~21kg CO2/year
+        equivalents_df['Trees Needed'] = equivalents_df['Annual CO₂'] / 21
+        st.dataframe(
+            equivalents_df,
+            width="stretch",
+            hide_index=True,
+            column_config={
+                'Annual CO₂': st.column_config.NumberColumn(format="%.0f kg CO₂/year"),
+                'Trees Needed': st.column_config.NumberColumn(
+                    format="≈ %.0f trees",
+                    help="Trees needed to offset one year of emissions"
+                )
+            }
+        )
     
+    greenest = min(metrics.values(), key=lambda v: v['monthly_carbon'])
+    greenest_annual = min(metrics.values(), key=lambda v: v['annual_carbon'])['annual_carbon']
+    dirtiest_annual = max(metrics.values(), key=lambda v: v['annual_carbon'])['annual_carbon']
+    carbon_saved = dirtiest_annual - greenest_annual
     st.success(f"""
     🌱 **Sustainability Insights:**
-    - Most eco-friendly: {min(metrics.items(), key=lambda x: x[1]['monthly_carbon'])[1]['name']}
-    - Choosing the greenest option would save {(max(metrics.items(), key=lambda x: x[1]['annual_carbon'])[1]['annual_carbon'] - min(metrics.items(), key=lambda x: x[1]['annual_carbon'])[1]['annual_carbon']):.0f} kg CO₂ per year
-    - That's equivalent to planting {((max(metrics.items(), key=lambda x: x[1]['annual_carbon'])[1]['annual_carbon'] - min(metrics.items(), key=lambda x: x[1]['annual_carbon'])[1]['annual_carbon']) / 21):.0f} trees! 🌳
+    - Most eco-friendly: {greenest['name']}
+    - Choosing the greenest option would save {carbon_saved:.0f} kg CO₂ per year
+    - That's equivalent to planting {(carbon_saved / 21):.0f} trees! 🌳
     """)
 
-with tab3:
+def render_multi_factor_tab(metrics, storage_gb, requests_millions):
+    """Draw the multi-factor (radar) analysis tab"""
     fig_radar = create_radar_chart(metrics)
     st.plotly_chart(fig_radar, use_container_width=True)
     
@@ -224,8 +259,29 @@ with tab3:
     - Perfect solution would fill the entire circle
     - Your priorities determine which dimensions matter most
     """)
+    
+    # How much the recommendation depends on the exact priority settings
+    st.subheader("Recommendation Robustness")
+    win_shares = compute_win_shares(storage_gb, requests_millions)
+    st.dataframe(
+        pd.DataFrame({
+            'Architecture': [data['name'] for data in metrics.values()],
+            'Recommended In': win_shares * 100
+        }),
+        width="stretch",
+        hide_index=True,
+        column_config={
+            'Recommended In': st.column_config.ProgressColumn(
+                format="%.0f%% of priority settings",
+                min_value=0,
+                max_value=100,
+                help="Share of all 1-10 priority combinations for this workload"
+            )
+        }
+    )
 
-with tab4:
+def render_projections_tab(metrics):
+    """Draw the 12-month projections tab"""
     st.subheader(" 12-Month Projections")
     
     col1, col2, col3 = st.columns(3)
@@ -237,25 +293,95 @@ with tab4:
             st.metric("Year 1 Carbon", f"{data['annual_carbon']:.0f} kg")
             st.metric("5-Year TCO", f"${data['annual_cost'] * 5:,.0f}")
 
+# Main content area
+# Everything that depends on the sliders lives in one fragment, so it can be
+# rerun on its own without redrawing the static parts of the page
+@st.fragment
+def render_dashboard(storage_gb, requests_millions,
+                     cost_weight, carbon_weight, security_weight):
+    """Draw the recommendation, comparison table and analysis tabs"""
+    # Get metrics and recommendation (cached on the user inputs)
+    metrics = compute_metrics(storage_gb, requests_millions,
+                              cost_weight, carbon_weight, security_weight)
+    recommendation = compute_recommendation(storage_gb, requests_millions,
+                                            cost_weight, carbon_weight, security_weight)
+
+    # Display recommendation
+    st.header(" Recommendation")
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.markdown(f"""
+<div class="recommendation-box">
+<h2 style="color: #2E7D32;">Recommended: {recommendation['recommended']}</h2>
+<p style="font-size: 1.1rem; color: #2E7D32;">
+{recommendation['reason']}
+</p>
+<p style="margin-top: 1rem; color: #2E7D32;">
+<strong>Overall Score: {recommendation['score']}/100</strong>
+</p>
+</div>
+""", unsafe_allow_html=True)
+
+    with col2:
+        fig_gauge = create_score_gauge(recommendation['score'], "Winner Score")
+        st.plotly_chart(fig_gauge, use_container_width=True)
+
+    # Key Metrics Overview
+    st.header(" Key Metrics Comparison")
+
+    # Display comparison table
+    st.subheader("Detailed Comparison Table")
+    comparison_df = create_comparison_table(metrics)
+    st.dataframe(
+        style_comparison_table(comparison_df),
+        use_container_width=True,
+        hide_index=True
+    )
+
+    # Visualizations in tabs
+    # Switching tabs reruns just this fragment, and only the open tab is built
+    tab1, tab2, tab3, tab4 = st.tabs([" Cost Analysis", " Environmental Impact", 
+                                       " Multi-Factor Analysis", " Projections"],
+                                      key="analysis_tab", on_change="rerun")
+
+    with tab1:
+        if tab1.open:
+            render_cost_tab(metrics)
+
+    with tab2:
+        if tab2.open:
+            render_carbon_tab(metrics)
+
+    with tab3:
+        if tab3.open:
+            render_multi_factor_tab(metrics, storage_gb, requests_millions)
+
+    with tab4:
+        if tab4.open:
+            render_projections_tab(metrics)
+
+render_dashboard(storage_gb, requests_millions,
+                 cost_weight, carbon_weight, security_weight)
+
 # Architecture Details Expander
+# These details don't depend on the sliders, so they come straight from data.py
 st.header(" Architecture Details")
 
-for arch, data in metrics.items():
+for arch, data in PRICING.items():
     with st.expander(f"{data['name']} - Detailed Information"):
         col1, col2 = st.columns(2)
         
         with col1:
             st.markdown("### Technical Specifications")
             st.write(f"**Description:** {data['description']}")
-            st.write(f"**Availability SLA:** {data['availability']}%")
+            st.write(f"**Availability SLA:** {AVAILABILITY[arch]}%")
             st.write(f"**Architecture Type:** {arch}")
             
             # Security breakdown
             st.markdown("### Security Features")
-            security = SECURITY_SCORES[arch]
-            for feature, score in security.items():
-                if feature != 'total':
-                    st.progress(score/100, text=f"{feature.replace('_', ' ').title()}: {score}/100")
+            for fraction, label in SECURITY_BREAKDOWN[arch]:
+                st.progress(fraction, text=label)
         
         with col2:
             st.markdown("### Cost Breakdown")
@@ -279,9 +405,4 @@ for arch, data in metrics.items():
 
 # Footer
 st.markdown("---")
-st.markdown("""
-<div style="text-align: center; color: #888; padding: 2rem;">
-    <p>🌱 Green Tech Cloud Architecture Decision Tool v1.0</p>
-    <p>Built with Streamlit, Python, and ❤️ for sustainable technology</p>
-</div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+st.markdown(FOOTER_HTML, unsafe_allow_html=True)
\ No newline at end of file
@@ -3,7 +3,112 @@ calculator.py - Performs all calculations
 This is where we compute costs, carbon, and scores
 """
 
-from data import PRICING, CARBON_FOOTPRINT, SECURITY_SCORES, AVAILABILITY
+import functools
+import numpy as np
+from data import (
+    ARCH_KEYS, ARCH_INDEX, NAMES, DESCRIPTIONS,
+    BASE_COST, COST_PER_GB, COST_PER_REQ,
+    BASE_CARBON, CARBON_PER_GB, CARBON_PER_REQ,
+    SECURITY_TOTAL, AVAILABILITY_SLA
+)
+
+def _round(values, ndigits=2):
+    """
+    Round every value in an array (of any shape) the same way round() does.
+    np.round can land on the other side of a halfway value (21.555 -> 21.56),
+    so this keeps the numbers identical to the per-architecture version.
+    """
+    values = np.asarray(values, dtype=float)
+    scale = 10.0 ** ndigits
+    rounded = np.asarray(np.round(values, ndigits))
+    
+    # np.round rounds the already rounded product values * scale, while round()
+    # rounds the exact value. They can only disagree next to a halfway point,
+    # so only fix up those entries: recover the exact product as
+    # product + error and check which side of the halfway point it falls on
+    product = values * scale
+    half = np.floor(product) + 0.5
+    ties = np.abs(product - half) < 1e-6
+    if ties.any():
+        error = _product_error(values[ties], scale, product[ties])
+        side = (product[ties] - half[ties]) + error
+        lower = half[ties] - 0.5
+        even = np.where(np.mod(lower, 2) == 0, lower, lower + 1)
+        rounded[ties] = np.where(side > 0, lower + 1,
+                                 np.where(side < 0, lower, even)) / scale
+    
+    return rounded
+
+def _product_error(a, b, product):
+    """
+    Exact rounding error of product = a * b, so that a * b == product + error
+    (Dekker's two-product, done with plain float arithmetic)
+    """
+    def split(x):
+        # Split x into a high and low half that multiply without rounding
+        c = 134217729.0 * x  # 2**27 + 1
+        high = c - (c - x)
+        return high, x - high
+    
+    a_high, a_low = split(a)
+    b_high, b_low = split(np.asarray(b, dtype=float))
+    return (((a_high * b_high - product) + a_high * b_low + a_low * b_high)
+            + a_low * b_low)
+
+# Cost and carbon only depend on the workload, not on the priority weights,
+# so they are cached per (storage_gb, requests_millions). The sliders move in
+# fixed steps, which keeps the number of distinct workloads small.
+# The cached arrays are shared between callers, so they are made read-only.
+@functools.lru_cache(maxsize=2048)
+def _monthly_costs(storage_gb, requests_millions):
+    """Monthly cost in USD for every architecture (in ARCH_KEYS order)"""
+    monthly_costs = _round(
+        BASE_COST +
+        (COST_PER_GB * storage_gb) +
+        (COST_PER_REQ * requests_millions)
+    )
+    monthly_costs.flags.writeable = False
+    return monthly_costs
+
+@functools.lru_cache(maxsize=2048)
+def _monthly_carbon(storage_gb, requests_millions):
+    """Monthly carbon footprint in kg CO2 for every architecture"""
+    monthly_carbon = _round(
+        BASE_CARBON +
+        (CARBON_PER_GB * storage_gb) +
+        (CARBON_PER_REQ * requests_millions)
+    )
+    monthly_carbon.flags.writeable = False
+    return monthly_carbon
+
+def _weighted_scores(cost, carbon, cost_weight, carbon_weight, security_weight):
+    """
+    Weighted overall score from monthly cost and carbon.
+    Weights must already be normalized to sum to 1.
+    """
+    security = SECURITY_TOTAL
+    
+    # Normalize scores (inverse for cost and carbon - lower is better)
+    # We use 1000 as max cost and 100 as max carbon for normalization
+    cost_score = np.maximum(0, 100 - (cost / 1000) * 100)
+    carbon_score = np.maximum(0, 100 - (carbon / 100) * 100)
+    security_score = security  # Already 0-100
+    
+    # Calculate weighted score
+    return (
+        cost_weight * cost_score +
+        carbon_weight * carbon_score +
+        security_weight * security_score
+    )
+
+# Recommendation reason for a dominant priority (or none)
+PRIORITIES = ('cost', 'carbon', 'security')
+REASONS = {
+    'security': "Based on your high security priority, this option provides the best protection while managing costs.",
+    'carbon': "This option minimizes environmental impact while maintaining security standards.",
+    'cost': "This option provides the best value for money with acceptable security and sustainability.",
+    'balanced': "This option provides the best balanced solution across all your priorities."
+}
 
 class ArchitectureCalculator:
     """
@@ -32,87 +137,85 @@ class ArchitectureCalculator:
         self.carbon_weight = carbon_weight / total_weight
         self.security_weight = security_weight / total_weight
     
-    def calculate_monthly_cost(self, architecture):
-        """Calculate monthly cost in USD"""
-        pricing = PRICING[architecture]
+    def monthly_costs(self):
+        """Calculate monthly cost in USD for every architecture (in ARCH_KEYS order)"""
+        return _monthly_costs(self.storage_gb, self.requests_millions)
+    
+    def annual_costs(self):
+        """Calculate annual cost for every architecture (monthly * 12)"""
+        return _round(self.monthly_costs() * 12, 2)
+    
+    def monthly_carbon(self):
+        """Calculate monthly carbon footprint in kg CO2 for every architecture"""
+        return _monthly_carbon(self.storage_gb, self.requests_millions)
+    
+    def annual_carbon(self):
+        """Calculate annual carbon footprint for every architecture"""
+        return _round(self.monthly_carbon() * 12, 2)
+    
+    def overall_scores(self, monthly_costs=None, monthly_carbon=None):
+        """
+        Calculate weighted overall score for every architecture.
+        This is the key decision metric!
         
-        monthly_cost = (
-            pricing['base_cost'] +
-            (pricing['cost_per_gb'] * self.storage_gb) +
-            (pricing['cost_per_million_requests'] * self.requests_millions)
-        )
+        Already computed monthly costs/carbon can be passed in to skip
+        working them out again.
+        """
+        
+        # Get raw values
+        cost = self.monthly_costs() if monthly_costs is None else monthly_costs
+        carbon = self.monthly_carbon() if monthly_carbon is None else monthly_carbon
+        
+        overall = _weighted_scores(cost, carbon, self.cost_weight,
+                                   self.carbon_weight, self.security_weight)
         
-        return round(monthly_cost, 2)
+        return _round(overall, 2)
+    
+    def calculate_monthly_cost(self, architecture):
+        """Calculate monthly cost in USD"""
+        return float(self.monthly_costs()[ARCH_INDEX[architecture]])
     
     def calculate_annual_cost(self, architecture):
         """Calculate annual cost (monthly * 12)"""
-        return round(self.calculate_monthly_cost(architecture) * 12, 2)
+        return float(self.annual_costs()[ARCH_INDEX[architecture]])
     
     def calculate_carbon_footprint(self, architecture):
         """Calculate monthly carbon footprint in kg CO2"""
-        carbon = CARBON_FOOTPRINT[architecture]
-        
-        monthly_carbon = (
-            carbon['base_carbon'] +
-            (carbon['carbon_per_gb'] * self.storage_gb) +
-            (carbon['carbon_per_million_requests'] * self.requests_millions)
-        )
-        
-        return round(monthly_carbon, 2)
+        return float(self.monthly_carbon()[ARCH_INDEX[architecture]])
     
     def calculate_annual_carbon(self, architecture):
         """Calculate annual carbon footprint"""
-        return round(self.calculate_carbon_footprint(architecture) * 12, 2)
+        return float(self.annual_carbon()[ARCH_INDEX[architecture]])
     
     def get_security_score(self, architecture):
         """Get security score (already calculated in our data)"""
-        return SECURITY_SCORES[architecture]['total']
+        return int(SECURITY_TOTAL[ARCH_INDEX[architecture]])
     
     def get_availability(self, architecture):
         """Get availability percentage"""
-        return AVAILABILITY[architecture]
+        return float(AVAILABILITY_SLA[ARCH_INDEX[architecture]])
     
     def calculate_overall_score(self, architecture):
-        """
-        Calculate weighted overall score.
-        This is the key decision metric!
-        """
-        
-        # Get raw values
-        cost = self.calculate_monthly_cost(architecture)
-        carbon = self.calculate_carbon_footprint(architecture)
-        security = self.get_security_score(architecture)
-        
-        # Normalize scores (inverse for cost and carbon - lower is better)
-        # We use 1000 as max cost and 100 as max carbon for normalization
-        cost_score = max(0, 100 - (cost / 1000) * 100)
-        carbon_score = max(0, 100 - (carbon / 100) * 100)
-        security_score = security  # Already 0-100
-        
-        # Calculate weighted score
-        overall = (
-            self.cost_weight * cost_score +
-            self.carbon_weight * carbon_score +
-            self.security_weight * security_score
-        )
-        
-        return round(overall, 2)
+        """Calculate weighted overall score for a single architecture"""
+        return float(self.overall_scores()[ARCH_INDEX[architecture]])
     
-    def get_recommendation(self):
+    def get_recommendation(self, metrics=None):
         """
         Determine which architecture is best based on weighted scores
+        
+        Pass the result of get_all_metrics() to reuse its overall scores
+        instead of scoring every architecture again.
         """
-        architectures = ['rds_multi_az', 'dynamodb', 'aurora_serverless']
-        scores = {}
+        if metrics is None:
+            metrics = self.get_all_metrics()
         
-        for arch in architectures:
-            scores[arch] = self.calculate_overall_score(arch)
+        scores = {arch: values['overall_score'] for arch, values in metrics.items()}
         
         # Find the best option
         best_arch = max(scores, key=scores.get)
         
         return {
-            'recommended': PRICING[best_arch]['name'],
+            'recommended': NAMES[ARCH_INDEX[best_arch]],
             'architecture_key': best_arch,
             'score': scores[best_arch],
             'all_scores': scores,
@@ -121,34 +224,114 @@ class ArchitectureCalculator:
     
     def _get_recommendation_reason(self, best_arch, scores):
         """Generate human-readable recommendation reason"""
-        if self.security_weight > 0.5:
-            return "Based on your high security priority, this option provides the best protection while managing costs."
-        elif self.carbon_weight > 0.5:
-            return "This option minimizes environmental impact while maintaining security standards."
-        elif self.cost_weight > 0.5:
-            return "This option provides the best value for money with acceptable security and sustainability."
-        else:
-            return "This option provides the best balanced solution across all your priorities."
+        # Weights sum to 1, so at most one of them can be above 0.5
+        weights = np.array([self.cost_weight, self.carbon_weight, self.security_weight])
+        if weights.max() > 0.5:
+            return REASONS[PRIORITIES[int(weights.argmax())]]
+        return REASONS['balanced']
     
     def get_all_metrics(self):
         """
         Get all metrics for all architectures.
         This will be used to create our comparison tables.
         """
-        architectures = ['rds_multi_az', 'dynamodb', 'aurora_serverless']
-        metrics = {}
+        # Work out every architecture at once, monthly figures only once
+        monthly_costs = self.monthly_costs()
+        monthly_carbon = self.monthly_carbon()
+        overall_scores = self.overall_scores(monthly_costs, monthly_carbon)
+        annual_costs = _round(monthly_costs * 12, 2)
+        annual_carbon = _round(monthly_carbon * 12, 2)
         
-        for arch in architectures:
-            metrics[arch] = {
-                'name': PRICING[arch]['name'],
-                'description': PRICING[arch]['description'],
-                'monthly_cost': self.calculate_monthly_cost(arch),
-                'annual_cost': self.calculate_annual_cost(arch),
-                'monthly_carbon': self.calculate_carbon_footprint(arch),
-                'annual_carbon': self.calculate_annual_carbon(arch),
-                'security_score': self.get_security_score(arch),
-                'availability': self.get_availability(arch),
-                'overall_score': self.calculate_overall_score(arch)
-            }
+        # Convert to plain Python numbers in one go per column
+        monthly_costs, monthly_carbon, annual_costs, annual_carbon, overall_scores = (
+            values.tolist() for values in
+            (monthly_costs, monthly_carbon, annual_costs, annual_carbon, overall_scores)
+        )
+        security_scores = SECURITY_TOTAL.tolist()
+        availability = AVAILABILITY_SLA.tolist()
         
-        return metrics
\ No newline at end of file
+        # Then build every architecture's dict in a single comprehension
+        return {
+            arch: {
+                'name': NAMES[i],
+                'description': DESCRIPTIONS[i],
+                'monthly_cost': monthly_costs[i],
+                'annual_cost': annual_costs[i],
+                'monthly_carbon': monthly_carbon[i],
+                'annual_carbon': annual_carbon[i],
+                'security_score': security_scores[i],
+                'availability': availability[i],
+                'overall_score': overall_scores[i]
+            }
+            for i, arch in enumerate(ARCH_KEYS)
+        }
+
+def score_scenarios(storage_gb, requests_millions,
+                    cost_weight, carbon_weight, security_weight):
+    """
+    Calculate overall scores for many scenarios at once
+    (e.g. sensitivity analysis or sweeping random weights).
+    
+    Every argument can be a single number or an array; they are broadcast
+    together. The result has one extra last axis holding the score of each
+    architecture in ARCH_KEYS order.
+    
+    Rounding follows ArchitectureCalculator exactly, so each row matches
+    its overall_scores():
+    
+    >>> scores = score_scenarios([1000, 9900], [100, 991], [5, 1], [5, 10], [5, 2])
+    >>> calculator = ArchitectureCalculator(9900, 991, 1, 10, 2)
+    >>> bool((scores[1] == calculator.overall_scores()).all())
+    True
+    """
+    storage_gb, requests_millions, cost_weight, carbon_weight, security_weight = (
+        np.asarray(value, dtype=float)[..., np.newaxis]
+        for value in (storage_gb, requests_millions,
+                      cost_weight, carbon_weight, security_weight)
+    )
+    
+    monthly_costs = _round(
+        BASE_COST + COST_PER_GB * storage_gb + COST_PER_REQ * requests_millions, 2
+    )
+    monthly_carbon = _round(
+        BASE_CARBON + CARBON_PER_GB * storage_gb + CARBON_PER_REQ * requests_millions, 2
+    )
+    
+    # Normalize weights to sum to 1 (like percentages)
+    total_weight = cost_weight + carbon_weight + security_weight
+    overall = _weighted_scores(monthly_costs, monthly_carbon,
+                               cost_weight / total_weight,
+                               carbon_weight / total_weight,
+                               security_weight / total_weight)
+    
+    return _round(overall, 2)
+
+if __name__ == '__main__':
+    # Self-check: `python calculator.py` compares score_scenarios with
+    # ArchitectureCalculator over the full slider grid and times a large sweep
+    import itertools
+    import time
+    
+    storage_grid = np.arange(100, 10001, 100)
+    requests_grid = np.arange(1, 1001, 10)
+    weight_sets = [(5, 5, 5), (1, 10, 2), (10, 1, 1), (1, 1, 10), (3, 7, 9)]
+    
+    storage, requests = np.meshgrid(storage_grid, requests_grid, indexing='ij')
+    for weights in weight_sets:
+        sweep = score_scenarios(storage, requests, *weights)
+        for (i, storage_gb), (j, requests_millions) in itertools.product(
+                enumerate(storage_grid), enumerate(requests_grid)):
+            calculator = ArchitectureCalculator(int(storage_gb), int(requests_millions), *weights)
+            assert (sweep[i, j] == calculator.overall_scores()).all(), \
+                (storage_gb, requests_millions, weights)
+    print(f"score_scenarios matches ArchitectureCalculator on "
+          f"{storage.size * len(weight_sets):,} slider settings")
+    
+    # Every workload on the slider grid with 100 different weight settings
+    weights = np.arange(1, 11)
+    storage, requests, cost_w, carbon_w = np.meshgrid(
+        storage_grid, requests_grid, weights, weights, indexing='ij'
+    )
+    start = time.perf_counter()
+    score_scenarios(storage, requests, cost_w, carbon_w, 5)
+    print(f"Scored {storage.size:,} scenarios in {time.perf_counter() - start:.2f}s")
@@ -3,6 +3,8 @@ data.py - Contains all our constants and fake data
 Think of this as our "database" of information
 """
 
+import numpy as np
+
 # AWS Pricing (simplified but realistic)
 PRICING = {
     'rds_multi_az': {
@@ -76,9 +78,40 @@ SECURITY_SCORES = {
     }
 }
 
+# Security feature progress bars for each architecture as (fraction, label)
+# pairs, built once at import since the scores never change
+SECURITY_BREAKDOWN = {
+    arch: [
+        (score / 100, f"{feature.replace('_', ' ').title()}: {score}/100")
+        for feature, score in scores.items()
+        if feature != 'total'
+    ]
+    for arch, scores in SECURITY_SCORES.items()
+}
+
 # Availability SLA (Service Level Agreement)
 AVAILABILITY = {
     'rds_multi_az': 99.95,  # ~22 minutes downtime/month
     'dynamodb': 99.99,      # ~4 minutes downtime/month  
     'aurora_serverless': 99.95
 }
+
+
+# The same numbers laid out as NumPy arrays, one entry per architecture in
+# ARCH_KEYS order, so the calculator can work on all architectures at once
+ARCH_KEYS = ('rds_multi_az', 'dynamodb', 'aurora_serverless')
+ARCH_INDEX = {arch: i for i, arch in enumerate(ARCH_KEYS)}
+
+NAMES = tuple(PRICING[arch]['name'] for arch in ARCH_KEYS)
+DESCRIPTIONS = tuple(PRICING[arch]['description'] for arch in ARCH_KEYS)
+
+BASE_COST = np.array([PRICING[arch]['base_cost'] for arch in ARCH_KEYS], dtype=float)
+COST_PER_GB = np.array([PRICING[arch]['cost_per_gb'] for arch in ARCH_KEYS])
+COST_PER_REQ = np.array([PRICING[arch]['cost_per_million_requests'] for arch in ARCH_KEYS])
+
+BASE_CARBON = np.array([CARBON_FOOTPRINT[arch]['base_carbon'] for arch in ARCH_KEYS], dtype=float)
+CARBON_PER_GB = np.array([CARBON_FOOTPRINT[arch]['carbon_per_gb'] for arch in ARCH_KEYS])
+CARBON_PER_REQ = np.array([CARBON_FOOTPRINT[arch]['carbon_per_million_requests'] for arch in ARCH_KEYS])
+
+SECURITY_TOTAL = np.array([SECURITY_SCORES[arch]['total'] for arch in ARCH_KEYS])
+AVAILABILITY_SLA = np.array([AVAILABILITY[arch] for arch in ARCH_KEYS])
@@ -3,66 +3,60 @@ visualizations.py - Creates all our charts and graphs
 Visualizations help people understand complex data quickly
 """
 
+import streamlit as st
 import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
+import altair as alt
+import numpy as np
 
-def create_cost_comparison_chart(metrics):
-    """
-    Create a bar chart comparing costs across architectures
-    """
-    architectures = list(metrics.keys())
-    monthly_costs = [metrics[arch]['monthly_cost'] for arch in architectures]
-    names = [metrics[arch]['name'] for arch in architectures]
-    
-    fig = go.Figure(data=[
-        go.Bar(
-            x=names,
-            y=monthly_costs,
-            text=[f'${cost:,.0f}' for cost in monthly_costs],
-            textposition='auto',
-            marker_color=['#FF6B6B', '#4ECDC4', '#45B7D1']
-        )
-    ])
-    
-    fig.update_layout(
-        title='Monthly Cost Comparison',
-        yaxis_title='Cost (USD)',
-        xaxis_title='Architecture Option',
-        showlegend=False,
-        height=400
-    )
-    
-    return fig
+# Charts and tables are cached on their inputs so Streamlit reruns with
+# unchanged inputs reuse the already built figure instead of rebuilding it
 
-def create_carbon_comparison_chart(metrics):
+# Color for each architecture, shared by every chart
+ARCH_COLORS = {
+    'rds_multi_az': '#FF6B6B',
+    'dynamodb': '#4ECDC4',
+    'aurora_serverless': '#45B7D1'
+}
+
+@st.cache_data(max_entries=128)
+def create_bar_chart(metrics, metric, title, value_title, label_format):
     """
-    Create a bar chart comparing carbon footprints
+    Create a bar chart comparing one metric (e.g. 'monthly_cost') across
+    architectures, with each bar labelled using label_format (e.g. '${:,.0f}').
+    This is a lightweight Altair chart rather than a full Plotly figure.
     """
-    architectures = list(metrics.keys())
-    carbon = [metrics[arch]['monthly_carbon'] for arch in architectures]
-    names = [metrics[arch]['name'] for arch in architectures]
-    
-    fig = go.Figure(data=[
-        go.Bar(
-            x=names,
-            y=carbon,
-            text=[f'{c:.1f} kg' for c in carbon],
-            textposition='auto',
-            marker_color=['#FF6B6B', '#4ECDC4', '#45B7D1']
-        )
-    ])
+    names = [metrics[arch]['name'] for arch in metrics.keys()]
+    values = [metrics[arch][metric] for arch in metrics.keys()]
+    
+    df = pd.DataFrame({
+        'Architecture': names,
+        'Value': values,
+        'Label': [label_format.format(value) for value in values]
+    })
+    
+    base = alt.Chart(df).encode(
+        x=alt.X('Architecture', sort=None, title='Architecture Option',
+                axis=alt.Axis(labelAngle=0)),
+        y=alt.Y('Value', title=value_title)
+    )
     
-    fig.update_layout(
-        title='Monthly Carbon Footprint',
-        yaxis_title='CO₂ Emissions (kg)',
-        xaxis_title='Architecture Option',
-        showlegend=False,
-        height=400
+    # Pin the colors to the names so they match the Plotly charts
+    bars = base.mark_bar().encode(
+        color=alt.Color(
+            'Architecture',
+            scale=alt.Scale(domain=names,
+                            range=[ARCH_COLORS[arch] for arch in metrics.keys()]),
+            legend=None
+        ),
+        tooltip=['Architecture', alt.Tooltip('Label', title=value_title)]
     )
+    labels = base.mark_text(baseline='bottom', dy=-4).encode(text='Label')
     
-    return fig
+    return (bars + labels).properties(title=title, height=400)
 
+@st.cache_data(max_entries=128)
 def create_radar_chart(metrics):
     """
     Create a radar chart showing all dimensions for each architecture.
@@ -71,14 +65,8 @@ def create_radar_chart(metrics):
     
     categories = ['Cost\nEfficiency', 'Carbon\nEfficiency', 'Security\nScore', 'Availability']
     
-    fig = go.Figure()
-    
-    colors = {
-        'rds_multi_az': '#FF6B6B',
-        'dynamodb': '#4ECDC4',
-        'aurora_serverless': '#45B7D1'
-    }
-    
+    # One long-form table (category, value, architecture) drives every trace
+    rows = []
     for arch in metrics.keys():
         # Normalize values for radar chart (0-100 scale)
         cost_efficiency = max(0, 100 - (metrics[arch]['monthly_cost'] / 10))
@@ -86,13 +74,22 @@ def create_radar_chart(metrics):
         security = metrics[arch]['security_score']
         availability = metrics[arch]['availability']
         
-        fig.add_trace(go.Scatterpolar(
-            r=[cost_efficiency, carbon_efficiency, security, availability],
-            theta=categories,
-            fill='toself',
-            name=metrics[arch]['name'],
-            line_color=colors[arch]
-        ))
+        rows.append(pd.DataFrame({
+            'category': categories,
+            'value': [cost_efficiency, carbon_efficiency, security, availability],
+            'architecture': metrics[arch]['name']
+        }))
+    df = pd.concat(rows, ignore_index=True)
+    
+    fig = px.line_polar(
+        df,
+        r='value',
+        theta='category',
+        color='architecture',
+        color_discrete_map={metrics[arch]['name']: ARCH_COLORS[arch] for arch in metrics.keys()},
+        line_close=True
+    )
+    fig.update_traces(fill='toself')
     
     fig.update_layout(
         polar=dict(
@@ -101,12 +98,14 @@ def create_radar_chart(metrics):
                 range=[0, 100]
             )),
         showlegend=True,
+        legend_title_text='',
         title="Multi-Dimensional Comparison",
         height=500
     )
     
     return fig
 
+@st.cache_data(max_entries=128)
 def create_score_gauge(score, title="Overall Score"):
     """
     Create a gauge chart showing the overall score.
@@ -145,59 +144,81 @@ def create_score_gauge(score, title="Overall Score"):
     fig.update_layout(height=300)
     return fig
 
+@st.cache_data(max_entries=128)
 def create_comparison_table(metrics):
     """
     Create a detailed comparison table.
     Tables are best for showing exact values.
     """
     
-    data = []
-    for arch, values in metrics.items():
-        data.append({
-            'Architecture': values['name'],
-            'Monthly Cost': f"${values['monthly_cost']:,.2f}",
-            'Annual Cost': f"${values['annual_cost']:,.2f}",
-            'Carbon (kg/month)': f"{values['monthly_carbon']:.1f}",
-            'Security Score': f"{values['security_score']}/100",
-            'Availability': f"{values['availability']}%",
-            'Overall Score': f"{values['overall_score']:.1f}"
-        })
+    # Build the table column by column (one list per column).
+    # Values stay numeric; style_comparison_table() handles the formatting.
+    values = list(metrics.values())
+    data = {
+        'Architecture': [v['name'] for v in values],
+        'Monthly Cost': [v['monthly_cost'] for v in values],
+        'Annual Cost': [v['annual_cost'] for v in values],
+        'Carbon (kg/month)': [v['monthly_carbon'] for v in values],
+        'Security Score': [v['security_score'] for v in values],
+        'Availability': [v['availability'] for v in values],
+        'Overall Score': [v['overall_score'] for v in values]
+    }
     
     df = pd.DataFrame(data)
     return df
 
+# How each numeric column of the comparison table is displayed
+COMPARISON_TABLE_FORMATS = {
+    'Monthly Cost': '${:,.2f}',
+    'Annual Cost': '${:,.2f}',
+    'Carbon (kg/month)': '{:.1f}',
+    'Security Score': '{}/100',
+    'Availability': '{}%',
+    'Overall Score': '{:.1f}'
+}
+
+def style_comparison_table(df):
+    """
+    Format the comparison table for display.
+    The numbers underneath stay numeric, so columns still sort correctly.
+    """
+    return df.style.format(COMPARISON_TABLE_FORMATS)
+
+@st.cache_data(max_entries=128)
 def create_annual_projection_chart(metrics, months=12):
     """
     Create a line chart showing cost projection over time
     """
     
-    fig = go.Figure()
-    
-    colors = {
-        'rds_multi_az': '#FF6B6B',
-        'dynamodb': '#4ECDC4',
-        'aurora_serverless': '#45B7D1'
-    }
-    
-    months_range = list(range(1, months + 1))
-    
-    for arch in metrics.keys():
-        monthly_cost = metrics[arch]['monthly_cost']
-        cumulative_costs = [monthly_cost * m for m in months_range]
-        
-        fig.add_trace(go.Scatter(
-            x=months_range,
-            y=cumulative_costs,
-            mode='lines+markers',
-            name=metrics[arch]['name'],
-            line=dict(color=colors[arch], width=2),
-            marker=dict(size=8)
-        ))
+    months_range = np.arange(1, months + 1, dtype=np.float64)
+    monthly_costs = np.array([metrics[arch]['monthly_cost'] for arch in metrics.keys()])
+    names = [metrics[arch]['name'] for arch in metrics.keys()]
+    
+    # Cumulative cost for every architecture (rows) and month (columns) at once
+    cumulative_costs = monthly_costs[:, None] * months_range[None, :]
+    
+    # Flatten into one long-form table (month, cost, architecture) and plot it in one go
+    df = pd.DataFrame({
+        'month': np.tile(months_range, len(names)),
+        'cost': cumulative_costs.ravel(),
+        'architecture': np.repeat(names, months)
+    })
+    
+    fig = px.line(
+        df,
+        x='month',
+        y='cost',
+        color='architecture',
+        color_discrete_map={metrics[arch]['name']: ARCH_COLORS[arch] for arch in metrics.keys()},
+        markers=True
+    )
+    fig.update_traces(line=dict(width=2), marker=dict(size=8))
     
     fig.update_layout(
         title='12-Month Cost Projection',
         xaxis_title='Months',
         yaxis_title='Cumulative Cost (USD)',
+        legend_title_text='',
         hovermode='x unified',
         height=400
     )